@@ -1,4 +1,30 @@
-class Color:
+import functools
+import os
+import sys
+
+# Decide once at import whether to emit escape codes at all: skip them when
+# stdout is not a terminal (piped/captured output) or the NO_COLOR convention
+# is in effect, so those modes pay zero ANSI bytes and zero allocations.
+_COLOR_ENABLED = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+
+class _ColorMeta(type):
+    """
+    Resolves Color.<name> helpers lazily from the module's colorizer table,
+    so the class carries a small data dict instead of a dozen near-identical
+    function objects defined up front.
+    """
+    def __getattr__(cls, name):
+        try:
+            colorizer = _COLOR_FNS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        # Cache on the class so later lookups bypass __getattr__ entirely.
+        setattr(cls, name, staticmethod(colorizer))
+        return colorizer
+
+
+class Color(metaclass=_ColorMeta):
     """
     A utility class for applying ANSI color and text attribute codes to strings
     for terminal output.
@@ -17,59 +43,90 @@ class Color:
     CYAN = "\033[36m"
     WHITE = "\033[37m"
 
+    # Combined bold+color codes using the SGR parameter-combining form
+    # ("\033[1;31m" instead of "\033[1m\033[31m"). Precomputed so the
+    # bold_* helpers emit a single escape sequence per call.
+    BOLD_RED = "\033[1;31m"
+    BOLD_GREEN = "\033[1;32m"
+    BOLD_YELLOW = "\033[1;33m"
+
     @staticmethod
     def _apply_color(text: str, color_code: str) -> str:
         """Applies a given ANSI color code to text and ensures it's reset."""
-        return f"{color_code}{text}{Color.RESET}"
-
-    @staticmethod
-    def black(text: str) -> str:
-        return Color._apply_color(text, Color.BLACK)
-
-    @staticmethod
-    def red(text: str) -> str:
-        return Color._apply_color(text, Color.RED)
+        return f"{color_code}{text}{Color.RESET}" if _COLOR_ENABLED else text
 
     @staticmethod
-    def green(text: str) -> str:
-        return Color._apply_color(text, Color.GREEN)
+    def compose(*styles: str) -> str:
+        """
+        Merges several SGR sequences into one combined sequence, e.g.
+        compose(Color.BOLD, Color.RED) -> "\\033[1;31m". Composed styles
+        then emit a single escape (and need a single trailing RESET)
+        instead of one escape per style.
+        """
+        return "\033[" + ";".join(style[2:-1] for style in styles) + "m"
 
-    @staticmethod
-    def yellow(text: str) -> str:
-        return Color._apply_color(text, Color.YELLOW)
 
-    @staticmethod
-    def blue(text: str) -> str:
-        return Color._apply_color(text, Color.BLUE)
+def _make_colorizer(color_code: str):
+    """
+    Builds a colorizer closure with the color and reset codes captured as
+    cell variables, so each call avoids the class-attribute lookups and
+    staticmethod dispatch that Color.<name>(text) used to incur.
 
-    @staticmethod
-    def magenta(text: str) -> str:
-        return Color._apply_color(text, Color.MAGENTA)
+    The closure is memoized: the game renders the same tiny alphabet of
+    colored strings ("[]", " .", status labels) thousands of times, so after
+    the first call each repeat is a cache hit returning the same str object
+    instead of rebuilding the f-string.
+    """
+    if not _COLOR_ENABLED:
+        def colorize(text: str) -> str:
+            return text
+        return colorize
 
-    @staticmethod
-    def cyan(text: str) -> str:
-        return Color._apply_color(text, Color.CYAN)
+    reset = Color.RESET
 
-    @staticmethod
-    def white(text: str) -> str:
-        return Color._apply_color(text, Color.WHITE)
+    @functools.lru_cache(maxsize=128)
+    def colorize(text: str) -> str:
+        return f"{color_code}{text}{reset}"
 
-    @staticmethod
-    def bold(text: str) -> str:
-        return Color._apply_color(text, Color.BOLD)
+    return colorize
 
-    @staticmethod
-    def underline(text: str) -> str:
-        return Color._apply_color(text, Color.UNDERLINE)
 
-    @staticmethod
-    def bold_red(text: str) -> str:
-        return Color._apply_color(text, f"{Color.BOLD}{Color.RED}")
+# Pre-bound module-level colorizers, built once at import time.
+black = _make_colorizer(Color.BLACK)
+red = _make_colorizer(Color.RED)
+green = _make_colorizer(Color.GREEN)
+yellow = _make_colorizer(Color.YELLOW)
+blue = _make_colorizer(Color.BLUE)
+magenta = _make_colorizer(Color.MAGENTA)
+cyan = _make_colorizer(Color.CYAN)
+white = _make_colorizer(Color.WHITE)
+bold = _make_colorizer(Color.BOLD)
+underline = _make_colorizer(Color.UNDERLINE)
+bold_red = _make_colorizer(Color.BOLD_RED)
+bold_green = _make_colorizer(Color.BOLD_GREEN)
+bold_yellow = _make_colorizer(Color.BOLD_YELLOW)
 
-    @staticmethod
-    def bold_green(text: str) -> str:
-        return Color._apply_color(text, f"{Color.BOLD}{Color.GREEN}")
+_COLOR_FNS = {
+    'black': black,
+    'red': red,
+    'green': green,
+    'yellow': yellow,
+    'blue': blue,
+    'magenta': magenta,
+    'cyan': cyan,
+    'white': white,
+    'bold': bold,
+    'underline': underline,
+    'bold_red': bold_red,
+    'bold_green': bold_green,
+    'bold_yellow': bold_yellow,
+}
 
-    @staticmethod
-    def bold_yellow(text: str) -> str:
-        return Color._apply_color(text, f"{Color.BOLD}{Color.YELLOW}")
+# Fully pre-rendered "[]" cell glyphs keyed by color index 0-7 (the standard
+# ANSI palette, which matches the curses COLOR_* constants used as tetromino
+# color ids). Built and interned once at import so a draw loop can look up a
+# shared str by integer key with no per-frame string construction at all.
+PRECOMPUTED_CELLS = {
+    color_index: sys.intern(f"\033[3{color_index}m[]{Color.RESET}")
+    for color_index in range(8)
+}
@@ -1,4 +1,6 @@
+import re
 import unittest
+from array import array
 from unittest.mock import patch # Import patch
 from tetris_game import GameEngine, UserInterface, LEFT, RIGHT, DOWN, SHAPES, Tetromino, TETROMINO_COLORS
 import curses
@@ -12,10 +14,28 @@ def mock_curses_color_pair(pair_id):
 # Patch curses.color_pair before any tests run
 curses.color_pair = mock_curses_color_pair
 
+# Tetromino colors hoisted to module constants: each use is a single name
+# load instead of a global dict lookup plus subscript.
+C_I, C_O, C_T, C_S, C_Z, C_J, C_L = (TETROMINO_COLORS[k] for k in 'IOTSZJL')
+
+def _reset_engine(engine):
+    # Re-zero the mutable state of a shared GameEngine, so tests can reuse
+    # one instance instead of constructing a fresh engine (and a fresh
+    # board) per test method. The engine's own in-place reset keeps both
+    # the engine and board identities stable.
+    engine.reset()
+
+
 class TestGameEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One engine for the whole class; setUp resets it in place.
+        cls._engine = GameEngine()
+
     def setUp(self):
-        self.engine = GameEngine()
-        
+        self.engine = self._engine
+        _reset_engine(self.engine)
+
     def test_new_tetromino_generation(self):
         tetromino = self.engine._get_next_tetromino()
         self.assertIsNotNone(tetromino)
@@ -44,10 +64,12 @@ class TestGameEngine(unittest.TestCase):
         
     def test_clear_lines(self):
         # Fill a line to be cleared with a specific color
-        test_color = TETROMINO_COLORS['I']
-        for x in range(self.engine.width):
-            self.engine.board[self.engine.height - 1][x] = test_color
-        
+        # (engine attributes hoisted to locals outside the fill loops)
+        test_color = C_I
+        board = self.engine.board
+        width = self.engine.width
+        board[self.engine.height - 1] = [test_color] * width
+
         initial_score = self.engine.score
         self.engine.clear_lines()
         
@@ -59,10 +81,11 @@ class TestGameEngine(unittest.TestCase):
         
         # Test multiple line clear
         self.setUp() # Reset the engine state for the second scenario
-        test_color = TETROMINO_COLORS['I'] # Re-define test_color after setUp
+        test_color = C_I # Re-define test_color after setUp
+        board = self.engine.board
+        width = self.engine.width
         for y in range(self.engine.height - 3, self.engine.height):
-            for x in range(self.engine.width):
-                self.engine.board[y][x] = test_color
+            board[y] = [test_color] * width
         
         initial_score = self.engine.score
         self.engine.clear_lines()
@@ -71,31 +94,31 @@ class TestGameEngine(unittest.TestCase):
 
     def test_check_collision_boundaries(self):
         # Test collision with left boundary
-        tetromino_i = Tetromino(shape='I', position=(-1, 0), rotation=0, color_id=TETROMINO_COLORS['I']) # Outside left
+        tetromino_i = Tetromino(shape='I', position=(-1, 0), rotation=0, color_id=C_I) # Outside left
         self.assertTrue(self.engine.check_collision(tetromino_i))
         
         # Test collision with right boundary
-        tetromino_i = Tetromino(shape='I', position=(self.engine.width - 3, 0), rotation=0, color_id=TETROMINO_COLORS['I']) # 'I' is 4 wide, so width-4 is max valid x
+        tetromino_i = Tetromino(shape='I', position=(self.engine.width - 3, 0), rotation=0, color_id=C_I) # 'I' is 4 wide, so width-4 is max valid x
         self.assertTrue(self.engine.check_collision(tetromino_i))
         
         # Test collision with bottom boundary
-        tetromino_i = Tetromino(shape='I', position=(0, self.engine.height), rotation=0, color_id=TETROMINO_COLORS['I']) # Outside bottom
+        tetromino_i = Tetromino(shape='I', position=(0, self.engine.height), rotation=0, color_id=C_I) # Outside bottom
         self.assertTrue(self.engine.check_collision(tetromino_i))
         
         # Test no collision
-        tetromino_i = Tetromino(shape='I', position=(0, 0), rotation=0, color_id=TETROMINO_COLORS['I'])
+        tetromino_i = Tetromino(shape='I', position=(0, 0), rotation=0, color_id=C_I)
         self.assertFalse(self.engine.check_collision(tetromino_i))
 
     def test_check_collision_with_blocks(self):
         # Place a block on the board with a color
-        self.engine.board[0][0] = TETROMINO_COLORS['O']
+        self.engine.board[0][0] = C_O
         
         # Test collision with existing block
-        tetromino_o = Tetromino(shape='O', position=(0, 0), rotation=0, color_id=TETROMINO_COLORS['O'])
+        tetromino_o = Tetromino(shape='O', position=(0, 0), rotation=0, color_id=C_O)
         self.assertTrue(self.engine.check_collision(tetromino_o))
         
         # Test no collision
-        tetromino_o = Tetromino(shape='O', position=(2, 2), rotation=0, color_id=TETROMINO_COLORS['O'])
+        tetromino_o = Tetromino(shape='O', position=(2, 2), rotation=0, color_id=C_O)
         self.assertFalse(self.engine.check_collision(tetromino_o))
 
     def test_rotate_tetromino(self):
@@ -116,8 +139,8 @@ class TestGameEngine(unittest.TestCase):
 
     def test_rotate_tetromino_collision(self):
         # Place blocks to block rotation, forcing a wall kick
-        self.engine.board[6][5] = TETROMINO_COLORS['S'] # Obstacle at row 6, column 5
-        self.engine.board[7][5] = TETROMINO_COLORS['S'] # Another obstacle to ensure no wall kick can easily resolve
+        self.engine.board[6][5] = C_S # Obstacle at row 6, column 5
+        self.engine.board[7][5] = C_S # Another obstacle to ensure no wall kick can easily resolve
         
         # 'I' tetromino at (5,5) rotation 0
         shape_name_i = 'I'
@@ -150,7 +173,7 @@ class TestGameEngine(unittest.TestCase):
 
     def test_move_tetromino_collision(self):
         # Place a block to block movement
-        self.engine.board[5][4] = TETROMINO_COLORS['J']
+        self.engine.board[5][4] = C_J
         
         shape_name_i = 'I'
         self.engine.current_tetromino = Tetromino(shape=shape_name_i, position=(5, 5), rotation=0, color_id=TETROMINO_COLORS[shape_name_i])
@@ -200,54 +223,61 @@ class TestGameEngine(unittest.TestCase):
 
     def test_game_over_on_new_tetromino(self):
         # Fill the top center of the board to ensure a new tetromino immediately collides
-        test_color = TETROMINO_COLORS['T']
+        test_color = C_T
         # Fill the area where a new tetromino would spawn (top 4 rows, center columns)
+        board = self.engine.board
+        width = self.engine.width
         for y in range(4): # Max height of a tetromino is 4
             for x_offset in range(4): # Max width of a tetromino is 4
-                board_x = self.engine.width // 2 - 2 + x_offset # Center 4 columns
-                if 0 <= board_x < self.engine.width:
-                    self.engine.board[y][board_x] = test_color
+                board_x = width // 2 - 2 + x_offset # Center 4 columns
+                if 0 <= board_x < width:
+                    board[y][board_x] = test_color
         
         # Place a piece that lands without clearing lines, to trigger new tetromino generation
-        self.engine.current_tetromino = Tetromino(shape='O', position=(0, self.engine.height - 1), rotation=0, color_id=TETROMINO_COLORS['O'])
+        self.engine.current_tetromino = Tetromino(shape='O', position=(0, self.engine.height - 1), rotation=0, color_id=C_O)
         self.engine.place_tetromino()
         
         self.assertTrue(self.engine.game_over)
 
     def test_game_over_on_new_tetromino_full_board(self):
         # Fill the top center of the board to ensure a new tetromino immediately collides
-        test_color = TETROMINO_COLORS['L']
+        test_color = C_L
         # Fill the area where a new tetromino would spawn (top 4 rows, center columns)
+        board = self.engine.board
+        width = self.engine.width
         for y in range(4): # Max height of a tetromino is 4
             for x_offset in range(4): # Max width of a tetromino is 4
-                board_x = self.engine.width // 2 - 2 + x_offset # Center 4 columns
-                if 0 <= board_x < self.engine.width:
-                    self.engine.board[y][board_x] = test_color
+                board_x = width // 2 - 2 + x_offset # Center 4 columns
+                if 0 <= board_x < width:
+                    board[y][board_x] = test_color
         
         # Place a piece that lands without clearing lines, to trigger new tetromino generation
-        self.engine.current_tetromino = Tetromino(shape='O', position=(0, self.engine.height - 1), rotation=0, color_id=TETROMINO_COLORS['O'])
+        self.engine.current_tetromino = Tetromino(shape='O', position=(0, self.engine.height - 1), rotation=0, color_id=C_O)
         self.engine.place_tetromino()
         
         self.assertTrue(self.engine.game_over)
 
     def test_level_increment(self):
         initial_level = self.engine.level
-        test_color = TETROMINO_COLORS['S']
-        
+        test_color = C_S
+        # Hoist the per-iteration engine lookups out of the fill loops
+        board = self.engine.board
+        width = self.engine.width
+        bottom = self.engine.height - 1
+        clear_lines = self.engine.clear_lines
+
         # Simulate clearing 10 lines to increment level by 1
         for _ in range(10):
-            for x in range(self.engine.width):
-                self.engine.board[self.engine.height - 1][x] = test_color
-            self.engine.clear_lines()
-            
+            board[bottom] = [test_color] * width
+            clear_lines()
+
         self.assertEqual(self.engine.level, initial_level + 1)
-        
+
         # Simulate clearing another 10 lines
         for _ in range(10):
-            for x in range(self.engine.width):
-                self.engine.board[self.engine.height - 1][x] = test_color
-            self.engine.clear_lines()
-            
+            board[bottom] = [test_color] * width
+            clear_lines()
+
         self.assertEqual(self.engine.level, initial_level + 2)
 
     def test_rotate_tetromino_wall_kick(self):
@@ -260,7 +290,7 @@ class TestGameEngine(unittest.TestCase):
         # The rotated 'T' at (initial_x, 0) would have a block at (initial_x + 1, 1)
         # which is (self.engine.width - 3 + 1, 1) = (self.engine.width - 2, 1)
         # So, place obstacle at board[1][self.engine.width - 2]
-        self.engine.board[1][self.engine.width - 2] = TETROMINO_COLORS['J']
+        self.engine.board[1][self.engine.width - 2] = C_J
         
         # Perform rotation
         self.engine.rotate_tetromino()
@@ -298,30 +328,52 @@ class TestGameEngine(unittest.TestCase):
 # Test cases for FFR-31: Pause Functionality
 
 
+# Precompiled matcher for SGR escape sequences, so any colored string passed
+# to MockStdscr.addstr is stripped before it pollutes the character grid and
+# breaks substring assertions.
+_ANSI_STRIP_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
 class MockStdscr:
     def __init__(self):
         self._screen = []
         self.height = 30
         self.width = 80
-        self.attrs = [] # To capture attributes
-        
+        self._attrs = [] # Dense per-cell attribute grid (one array row per screen row)
+
     def getmaxyx(self):
         return self.height, self.width
 
+    def erase(self):
+        self.clear() # The mock draws straight to its grid; erase == clear
+
     def clear(self):
-        self._screen = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        self.attrs = []
+        # One bytearray per row instead of width single-character str objects,
+        # so clear() is height allocations and addstr() is a slice assignment.
+        self._screen = [bytearray(b' ' * self.width) for _ in range(self.height)]
+        # Structure-of-arrays attribute capture: a machine-int array per row
+        # instead of one (y, x, attr) tuple allocation per written character.
+        self._attrs = [array('l', [0]) * self.width for _ in range(self.height)]
 
     def addstr(self, y, x, text, attr=0): # Add attr parameter
         if 0 <= y < self.height and 0 <= x < self.width:
-            for i, char in enumerate(text):
-                if x + i < self.width:
-                    self._screen[y][x + i] = char
-                    self.attrs.append((y, x + i, attr)) # Capture attribute
+            if '\x1b' in text:
+                text = _ANSI_STRIP_RE.sub("", text)
+            clipped = text[:self.width - x]
+            self._screen[y][x:x + len(clipped)] = clipped.encode('ascii', 'replace')
+            self._attrs[y][x:x + len(clipped)] = array('l', [attr]) * len(clipped) # Capture attributes
+
+    def as_text(self):
+        # Snapshot the whole screen as one newline-joined string, so tests
+        # can assert on message presence with a single substring search.
+        return "\n".join(row.decode('ascii') for row in self._screen)
 
     def refresh(self):
         pass # No actual refresh in mock
 
+    def noutrefresh(self):
+        pass # No staged refresh in mock either
+
     def nodelay(self, arg):
         pass
 
@@ -342,37 +394,44 @@ class MockStdscr:
         self.current_attr = 0 # Reset attribute
 
 class TestUserInterface(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Share one engine and one mock screen across the class; setUp
+        # resets both in place rather than reallocating their buffers.
+        cls._engine = GameEngine()
+        cls._mock_stdscr = MockStdscr()
+
     def setUp(self):
-        self.engine = GameEngine()
-        self.mock_stdscr = MockStdscr()
+        self.engine = self._engine
+        _reset_engine(self.engine)
+        self.mock_stdscr = self._mock_stdscr
+        self.mock_stdscr.clear()
         self.ui = UserInterface(self.engine, self.mock_stdscr, is_test_mode=True)
-        
+
+    def _assert_region(self, y, x, expected):
+        # Compare one decoded screen slice instead of per-character asserts;
+        # a failure then prints the whole region on both sides.
+        actual = self.mock_stdscr._screen[y][x:x + len(expected)].decode('ascii')
+        self.assertEqual(actual, expected)
+
     def test_draw_board_empty(self):
         self.ui.draw_board()
         # Check if the board is drawn with empty cells
         # Each cell is " ." so 10 columns * 2 chars = 20 chars per row
         # 20 rows * 20 chars = 400 chars for the board part
         # Plus score and next tetromino lines
-        
+
         # A simple check: ensure the top-left is an empty cell representation
-        self.assertEqual(self.mock_stdscr._screen[0][0], ' ')
-        self.assertEqual(self.mock_stdscr._screen[0][1], '.')
+        self._assert_region(0, 0, ' .')
 
     def test_draw_board_with_tetromino(self):
         shape_name = 'O'
         self.engine.current_tetromino = Tetromino(shape=shape_name, position=(0, 0), rotation=0, color_id=TETROMINO_COLORS[shape_name])
         self.ui.draw_board()
-        
-        # Check if the tetromino is drawn
-        self.assertEqual(self.mock_stdscr._screen[0][0], '[')
-        self.assertEqual(self.mock_stdscr._screen[0][1], ']')
-        self.assertEqual(self.mock_stdscr._screen[0][2], '[')
-        self.assertEqual(self.mock_stdscr._screen[0][3], ']')
-        
-        self.assertEqual(self.mock_stdscr._screen[1][0], '[')
-        self.assertEqual(self.mock_stdscr._screen[1][1], ']')
-        self.assertEqual(self.mock_stdscr._screen[1][2], '[')
-        self.assertEqual(self.mock_stdscr._screen[1][3], ']')
+
+        # Check if the tetromino is drawn ('O' covers a 2x2 block region)
+        self._assert_region(0, 0, '[][]')
+        self._assert_region(1, 0, '[][]')
 
     def test_draw_game_over(self):
         self.engine.game_over = True
@@ -383,14 +442,8 @@ class TestUserInterface(unittest.TestCase):
         message_y = self.engine.height // 2
         message_x = self.engine.width - 5 # This positioning might need adjustment based on actual UI
         
-        # Find the start of the message in the mock screen
-        found = False
-        for y in range(self.mock_stdscr.height):
-            screen_row_str = "".join(self.mock_stdscr._screen[y])
-            if game_over_message in screen_row_str:
-                found = True
-                break
-        self.assertTrue(found, f"'{game_over_message}' not found on screen.")
+        # Search the whole screen snapshot at once
+        self.assertIn(game_over_message, self.mock_stdscr.as_text())
 
     def test_draw_level_and_time(self):
         self.engine.level = 5
@@ -400,23 +453,10 @@ class TestUserInterface(unittest.TestCase):
         level_message = f"Level: {self.engine.level}"
         time_message = f"Time: {self.engine.time_elapsed}s"
         
-        # Check for Level message
-        found_level = False
-        for y in range(self.mock_stdscr.height):
-            screen_row_str = "".join(self.mock_stdscr._screen[y])
-            if level_message in screen_row_str:
-                found_level = True
-                break
-        self.assertTrue(found_level, f"'{level_message}' not found on screen.")
-
-        # Check for Time message
-        found_time = False
-        for y in range(self.mock_stdscr.height):
-            screen_row_str = "".join(self.mock_stdscr._screen[y])
-            if time_message in screen_row_str:
-                found_time = True
-                break
-        self.assertTrue(found_time, f"'{time_message}' not found on screen.")
+        # Check for Level and Time messages in one screen snapshot
+        screen_text = self.mock_stdscr.as_text()
+        self.assertIn(level_message, screen_text)
+        self.assertIn(time_message, screen_text)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,48 +1,53 @@
 import curses
 from collections import namedtuple
+import os
 import random
+import select
+import sys
 import time
 
 # Named tuples for better readability and structure
 GameBoard = namedtuple('GameBoard', ['width', 'height', 'blocks'])
 Tetromino = namedtuple('Tetromino', ['shape', 'position', 'rotation', 'color_id'])
 
-# Tetromino shapes and their rotations. Each shape is a list of 2D arrays,
-# where each 2D array represents a rotation state. '1' indicates a block, '0' is empty.
+# Tetromino shapes and their rotations. Each shape is a tuple of 2D masks,
+# where each mask represents a rotation state. '1' indicates a block, '0' is
+# empty. Tuples rather than lists: the shape data is immutable, shared
+# safely, and slightly cheaper to index.
 SHAPES = {
-    'I': [
-        [[1, 1, 1, 1]], # 0 degrees (horizontal)
-        [[1], [1], [1], [1]] # 90 degrees (vertical)
-    ],
-    'O': [
-        [[1, 1], [1, 1]] # 0 degrees (square, no rotation effect)
-    ],
-    'T': [
-        [[0, 1, 0], [1, 1, 1]], # 0 degrees
-        [[1, 0], [1, 1], [1, 0]], # 90 degrees
-        [[1, 1, 1], [0, 1, 0]], # 180 degrees
-        [[0, 1], [1, 1], [0, 1]] # 270 degrees
-    ],
-    'S': [
-        [[0, 1, 1], [1, 1, 0]], # 0 degrees
-        [[1, 0], [1, 1], [0, 1]] # 90 degrees
-    ],
-    'Z': [
-        [[1, 1, 0], [0, 1, 1]], # 0 degrees
-        [[0, 1], [1, 1], [1, 0]] # 90 degrees
-    ],
-    'J': [
-        [[1, 0, 0], [1, 1, 1]], # 0 degrees
-        [[1, 1], [1, 0], [1, 0]], # 90 degrees
-        [[1, 1, 1], [0, 0, 1]], # 180 degrees
-        [[0, 1], [0, 1], [1, 1]] # 270 degrees
-    ],
-    'L': [
-        [[0, 0, 1], [1, 1, 1]], # 0 degrees
-        [[1, 0], [1, 0], [1, 1]], # 90 degrees
-        [[1, 1, 1], [1, 0, 0]], # 180 degrees
-        [[1, 1], [0, 1], [0, 1]] # 270 degrees
-    ]
+    'I': (
+        ((1, 1, 1, 1),), # 0 degrees (horizontal)
+        ((1,), (1,), (1,), (1,)) # 90 degrees (vertical)
+    ),
+    'O': (
+        ((1, 1), (1, 1)), # 0 degrees (square, no rotation effect)
+    ),
+    'T': (
+        ((0, 1, 0), (1, 1, 1)), # 0 degrees
+        ((1, 0), (1, 1), (1, 0)), # 90 degrees
+        ((1, 1, 1), (0, 1, 0)), # 180 degrees
+        ((0, 1), (1, 1), (0, 1)) # 270 degrees
+    ),
+    'S': (
+        ((0, 1, 1), (1, 1, 0)), # 0 degrees
+        ((1, 0), (1, 1), (0, 1)) # 90 degrees
+    ),
+    'Z': (
+        ((1, 1, 0), (0, 1, 1)), # 0 degrees
+        ((0, 1), (1, 1), (1, 0)) # 90 degrees
+    ),
+    'J': (
+        ((1, 0, 0), (1, 1, 1)), # 0 degrees
+        ((1, 1), (1, 0), (1, 0)), # 90 degrees
+        ((1, 1, 1), (0, 0, 1)), # 180 degrees
+        ((0, 1), (0, 1), (1, 1)) # 270 degrees
+    ),
+    'L': (
+        ((0, 0, 1), (1, 1, 1)), # 0 degrees
+        ((1, 0), (1, 0), (1, 1)), # 90 degrees
+        ((1, 1, 1), (1, 0, 0)), # 180 degrees
+        ((1, 1), (0, 1), (0, 1)) # 270 degrees
+    )
 }
 
 # Map tetromino shapes to curses color constants
@@ -57,11 +62,110 @@ TETROMINO_COLORS = {
     'L': curses.COLOR_WHITE # Using white as a placeholder for orange
 }
 
+# Shape names as a reusable tuple, so bag refills don't rebuild a list from
+# the SHAPES dict keys every seven pieces.
+_SHAPE_NAMES = tuple(SHAPES)
+
+# Precomputed drawable cells for every shape and rotation: just the filled
+# (dx, dy) offsets, built once at import. Render loops iterate at most four
+# small tuples instead of re-scanning the full 2D mask (and its zero cells)
+# every frame.
+SHAPE_CELLS = {
+    name: [tuple((dx, dy) for dy, row in enumerate(rot) for dx, cell in enumerate(row) if cell)
+           for rot in rotations]
+    for name, rotations in SHAPES.items()
+}
+
+def _bottom_profile(cells):
+    """Returns (dx, lowest dy) pairs — the underside of a shape rotation."""
+    profile = {}
+    for dx, dy in cells:
+        if dy > profile.get(dx, -1):
+            profile[dx] = dy
+    return tuple(profile.items())
+
+# The lowest filled offset of each column of every rotation, used to land a
+# piece against the per-column stack heights in constant time.
+SHAPE_BOTTOM = {
+    name: [_bottom_profile(cells) for cells in rotations]
+    for name, rotations in SHAPE_CELLS.items()
+}
+
+# Help-screen control descriptions, built once here instead of twice per
+# draw_help_screen call.
+HELP_CONTROLS = (
+    "Left Arrow: Move Left",
+    "Right Arrow: Move Right",
+    "Z: Rotate",
+    "Down Arrow: Soft Drop",
+    "Spacebar: Hard Drop",
+    "C: Hold Piece",
+    "H: Toggle Help Screen",
+    "Q: Quit Game",
+    "R (Game Over): Restart Game"
+)
+
 # Direction vectors for movement (dx, dy)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 DOWN = (0, 1)
 
+# Wall-kick offsets tried in order when a rotation collides, with (0, 0)
+# first so the unobstructed common case commits after a single test. The
+# sequence keeps the engine's simplified horizontal kicks; guideline SRS
+# tables assume the 4-state 4x4 piece frames of the official rotation
+# system, which these trimmed bounding-box shapes do not use.
+KICK_OFFSETS = ((0, 0), (-1, 0), (1, 0), (-2, 0), (2, 0))
+
+def _build_collider(cells, bbox_width, bbox_height):
+    """
+    Generates a fully unrolled collision function for one shape rotation.
+
+    The emitted source first rejects the piece's bounding box against the
+    board edges (equivalent to the per-cell boundary checks, because every
+    row and column of the trimmed shapes contains a block), then tests the
+    occupancy of each filled cell as straight-line code — no loops, no
+    zero-cell iterations, no shape-data indexing at call time.
+
+    Args:
+        cells (tuple): The filled (dx, dy) offsets of the rotation.
+        bbox_width (int): The rotation's bounding-box width.
+        bbox_height (int): The rotation's bounding-box height.
+
+    Returns:
+        function: collide(board, px, py, width, height) -> bool.
+    """
+    # Group the filled cells by row so each touched board row is fetched
+    # exactly once and its cells are tested together, mirroring the
+    # row-at-a-time shape of a bitmask test.
+    cells_by_row = {}
+    for dx, dy in cells:
+        cells_by_row.setdefault(dy, []).append(dx)
+
+    lines = [
+        "def collide(board, px, py, width, height):",
+        f"    if px < 0 or py < 0 or px + {bbox_width} > width or py + {bbox_height} > height:",
+        "        return True",
+    ]
+    for dy in sorted(cells_by_row):
+        occupancy = " or ".join(f"row[px + {dx}]" for dx in sorted(cells_by_row[dy]))
+        lines.append(f"    row = board[py + {dy}]")
+        lines.append(f"    if {occupancy}:")
+        lines.append("        return True")
+    lines.append("    return False")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['collide']
+
+# Specialized collision functions, generated once at import and dispatched
+# by (shape, rotation).
+_COLLIDERS = {
+    (name, rotation): _build_collider(cells, len(SHAPES[name][rotation][0]), len(SHAPES[name][rotation]))
+    for name, rotations in SHAPE_CELLS.items()
+    for rotation, cells in enumerate(rotations)
+}
+
 class GameEngine:
     """
     Manages the core logic of the Tetris game, including the game board,
@@ -80,36 +184,81 @@ class GameEngine:
         """
         self.width = width
         self.height = height
-        # The game board, represented as a 2D list. 0 for empty, 1 for filled block.
-        self.board = [[0] * width for _ in range(height)]
-        
+        # The game board: one bytearray row per board row, 0 for empty, else
+        # the block's curses color constant (all fit in a byte). Compared to
+        # lists of ints this is one byte per cell, cell reads are raw byte
+        # fetches, and the full-row check is a C-level scan.
+        self.board = [bytearray(width) for _ in range(height)]
+        # Bumped whenever settled content changes (placement, line clears),
+        # so the UI can tell a moved piece apart from a changed board and
+        # only repaint what it must.
+        self.board_version = 0
+
+        # Fixed tuning knobs
+        self.lock_delay = 0.5
+        self.entry_delay = 0.1
+
+        self.high_score = self._load_high_score()
+        self._saved_high_score = self.high_score # What highscore.txt currently holds
+
+        # Invoked with the new fall_delay when the level increases, so the
+        # caller reacts to the event instead of polling a flag every frame.
+        # Registered once and kept across reset() calls.
+        self.on_level_up = None
+
+        self.reset(start_level)
+
+    def reset(self, start_level=1):
+        """
+        Re-initializes all per-game state in place for a (re)start. The
+        engine and its board keep their identities, so the UI and anything
+        else holding references never needs re-pointing at new objects.
+
+        Args:
+            start_level (int): The initial level of the new game.
+        """
+        self.board[:] = [bytearray(self.width) for _ in range(self.height)]
+        # Topmost filled row per column (height = empty column), maintained
+        # incrementally so the ghost piece lands in O(1) instead of walking
+        # the board row by row.
+        self.col_heights = [self.height] * self.width
+        self.board_version += 1 # The (now empty) settled content changed
+
         # Current falling tetromino and the next one in queue
         self.current_tetromino = None # Will be set by _get_next_tetromino
         self.next_tetrominoes = [] # List of upcoming tetrominoes
         self.held_tetromino = None # Initialize held tetromino
-        
+
         # Game statistics
         self.score = 0
         self.level = start_level
         self.lines_cleared_total = (start_level - 1) * 10 # Adjust total lines cleared for starting level
         self.time_elapsed = 0
-        
+
         # Game state flags
         self.game_over = False
-        self.tetromino_bag = []
-        self.level_up = False
-        self.lock_delay = 0.5
+        # Two pre-shuffled bags: pieces come from the current bag, and when
+        # it drains the full next bag swaps in, so a refill is one swap plus
+        # one shuffle instead of a rebuild check on every generation.
+        self._bag_curr = self._new_bag()
+        self._bag_next = self._new_bag()
         self.landing_time = None
-        self.entry_delay = 0.1
         self.combo_count = 0
         self.last_clear_was_tetris = False
+        # Rows flashed by the line-clear effect, and the monotonic deadline
+        # until which the effect (and gravity pause) lasts.
+        self.cleared_lines = []
+        self.animation_until_ns = 0
         self.fall_delay = max(0.1, 0.5 - (self.level - 1) * 0.05) # Initial fall delay based on start_level
-        self.high_score = self._load_high_score()
-        
-        # Initialize first tetrominoes
-        for _ in range(3): # Populate with 3 next tetrominoes
-            self.next_tetrominoes.append(self._generate_random_tetromino())
+        # Integer twin of fall_delay for the loop's deadline arithmetic:
+        # one attribute load per gravity tick, no float multiply or cast.
+        self.fall_delay_ns = int(self.fall_delay * 1_000_000_000)
+
+        # Initialize first tetrominoes (3 in the preview queue)
+        self.next_tetrominoes = [self._generate_random_tetromino() for _ in range(3)]
         self.current_tetromino = self._get_next_tetromino()
+        # Memo key of the last ghost computation; see calculate_ghost_piece_position.
+        self._ghost_key = None
         self.calculate_ghost_piece_position()
 
     def _load_high_score(self):
@@ -124,10 +273,16 @@ class GameEngine:
 
     def _save_high_score(self):
         """
-        Saves the high score to a file.
+        Saves the high score to a file, skipping the write entirely when the
+        stored value is already current. The write goes through a temp file
+        and os.replace so a crash mid-write cannot truncate the high score.
         """
-        with open("highscore.txt", "w") as f:
+        if self.high_score == self._saved_high_score:
+            return
+        with open("highscore.txt.tmp", "w") as f:
             f.write(str(self.high_score))
+        os.replace("highscore.txt.tmp", "highscore.txt")
+        self._saved_high_score = self.high_score
 
     def hold_tetromino(self):
         """
@@ -144,35 +299,64 @@ class GameEngine:
             self.current_tetromino = self.current_tetromino._replace(position=(self.width // 2 - len(SHAPES[self.current_tetromino.shape][0][0]) // 2, 0))
 
         self.can_hold = False
-        self.calculate_ghost_piece_position()
 
     def calculate_ghost_piece_position(self):
         """
         Calculates the final landing position of the current tetromino.
+
+        Uses the per-column stack heights: the landing row is bounded by the
+        tightest column under the piece, so the common case is a constant
+        amount of arithmetic with no per-row collision checks.
+
+        The result is memoized on (shape, rotation, x, board_version): a
+        soft drop changes only y, so the ghost of a falling piece is a
+        cache hit every tick until it moves sideways, rotates, or lands.
         """
         if self.current_tetromino is None:
             self.ghost_piece_position = None
+            self._ghost_key = None
+            return
+
+        shape = self.current_tetromino.shape
+        rotation = self.current_tetromino.rotation
+        px, py = self.current_tetromino.position
+        key = (shape, rotation, px, self.board_version)
+        if (key == self._ghost_key and self.ghost_piece_position is not None
+                and py <= self.ghost_piece_position[1]):
             return
 
-        ghost_tetromino = self.current_tetromino
-        while not self.check_collision(ghost_tetromino):
-            ghost_tetromino = Tetromino(
-                shape=ghost_tetromino.shape,
-                position=(ghost_tetromino.position[0], ghost_tetromino.position[1] + 1),
-                rotation=ghost_tetromino.rotation,
-                color_id=ghost_tetromino.color_id
-            )
-        self.ghost_piece_position = (ghost_tetromino.position[0], ghost_tetromino.position[1] - 1)
+        col_heights = self.col_heights
+        ghost_y = min(col_heights[px + dx] - bottom_dy - 1
+                      for dx, bottom_dy in SHAPE_BOTTOM[shape][rotation])
+        if ghost_y < py:
+            # The piece sits below a column top (tucked under an overhang);
+            # fall back to walking down from its current position. The
+            # result depends on y here, so it must not be memoized.
+            collide = _COLLIDERS[shape, rotation]
+            ghost_y = py
+            while not collide(self.board, px, ghost_y + 1, self.width, self.height):
+                ghost_y += 1
+            self._ghost_key = None
+        else:
+            self._ghost_key = key
+        self.ghost_piece_position = (px, ghost_y)
+
+    def _new_bag(self):
+        """
+        Returns a freshly shuffled bag of all seven shape names.
+        """
+        bag = list(_SHAPE_NAMES)
+        random.shuffle(bag)
+        return bag
 
     def _generate_random_tetromino(self):
         """
         Generates a new random tetromino.
         """
-        if not self.tetromino_bag:
-            self.tetromino_bag = list(SHAPES.keys())
-            random.shuffle(self.tetromino_bag)
+        if not self._bag_curr:
+            self._bag_curr, self._bag_next = self._bag_next, self._new_bag()
 
-        shape_name = self.tetromino_bag.pop()
+        shape_name = self._bag_curr.pop()
         shape_data = SHAPES[shape_name][0] 
         position = (self.width // 2 - len(shape_data[0]) // 2, 0) 
         rotation = 0
@@ -194,16 +378,23 @@ class GameEngine:
         Then clears any completed lines, updates the score and level,
         and generates the next tetromino.
         """
-        current_shape_data = SHAPES[self.current_tetromino.shape][self.current_tetromino.rotation]
-        for y_offset, row in enumerate(current_shape_data):
-            for x_offset, cell in enumerate(row):
-                if cell: # If it's a block in the tetromino shape
-                    board_x = self.current_tetromino.position[0] + x_offset
-                    board_y = self.current_tetromino.position[1] + y_offset
-                    # Ensure coordinates are within board boundaries before placing
-                    if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                        self.board[board_y][board_x] = self.current_tetromino.color_id
-        
+        # Bind the loop invariants to locals once, outside the loop
+        cells = SHAPE_CELLS[self.current_tetromino.shape][self.current_tetromino.rotation]
+        px, py = self.current_tetromino.position
+        color_id = self.current_tetromino.color_id
+        board = self.board
+        col_heights = self.col_heights
+        width, height = self.width, self.height
+        for x_offset, y_offset in cells:
+            board_x = px + x_offset
+            board_y = py + y_offset
+            # Ensure coordinates are within board boundaries before placing
+            if 0 <= board_y < height and 0 <= board_x < width:
+                board[board_y][board_x] = color_id
+                if board_y < col_heights[board_x]:
+                    col_heights[board_x] = board_y
+        self.board_version += 1
+
         lines_cleared = self.clear_lines()
 
         # Move the next tetromino to become the current one
@@ -225,18 +416,24 @@ class GameEngine:
         Checks for and clears any completed horizontal lines on the board.
         Updates the score and level based on the number of lines cleared.
         """
-        cleared_lines_indices = []
-        for y in range(self.height):
-            if all(self.board[y]):
-                cleared_lines_indices.append(y)
+        # Detect full rows with the C-level `in` scan rather than a
+        # Python-level all() generator per row.
+        cleared_lines_indices = [y for y, row in enumerate(self.board) if 0 not in row]
 
         if not cleared_lines_indices:
             self.last_clear_was_tetris = False
             return False
 
-        for y in cleared_lines_indices:
-            self.board.pop(y)
-            self.board.insert(0, [0] * self.width)
+        # Rebuild the board in one pass: fresh empty rows on top, surviving
+        # rows below. Each pop(y)/insert(0, ...) pair shifted the whole row
+        # list, making the old loop O(cleared * height). Slice-assign so the
+        # board object keeps its identity for anyone holding a reference.
+        full_rows = set(cleared_lines_indices)
+        kept_rows = [row for y, row in enumerate(self.board) if y not in full_rows]
+        self.board[:] = [bytearray(self.width) for _ in cleared_lines_indices] + kept_rows
+        # Removing rows shifts the stack, so rebuild the column heights.
+        self._recompute_col_heights()
+        self.board_version += 1
 
         lines_cleared = len(cleared_lines_indices)
         
@@ -260,14 +457,32 @@ class GameEngine:
         if lines_cleared > 0:
             self.lines_cleared_total += lines_cleared
             new_level = 1 + (self.lines_cleared_total // 10)
-            if new_level > self.level:
-                self.level_up = True
+            leveled_up = new_level > self.level
             self.level = new_level
             self.fall_delay = max(0.1, 0.5 - (self.level - 1) * 0.05)
+            self.fall_delay_ns = int(self.fall_delay * 1_000_000_000)
+            if leveled_up and self.on_level_up is not None:
+                self.on_level_up(self.fall_delay)
         
         self.cleared_lines = cleared_lines_indices
+        self.animation_until_ns = time.monotonic_ns() + 150_000_000 # 150ms flash
         return True
 
+    def _recompute_col_heights(self):
+        """
+        Rescans the board to rebuild the topmost filled row of each column.
+        """
+        board = self.board
+        col_heights = self.col_heights
+        height = self.height
+        for x in range(self.width):
+            for y in range(height):
+                if board[y][x]:
+                    col_heights[x] = y
+                    break
+            else:
+                col_heights[x] = height
+
     def check_collision(self, tetromino):
         """
         Checks if a given tetromino's current position and rotation
@@ -280,22 +495,25 @@ class GameEngine:
         Returns:
             bool: True if a collision is detected, False otherwise.
         """
-        shape_data = SHAPES[tetromino.shape][tetromino.rotation]
-        for y_offset, row in enumerate(shape_data):
-            for x_offset, cell in enumerate(row):
-                if cell: # Only check for blocks that are part of the tetromino
-                    board_x = tetromino.position[0] + x_offset
-                    board_y = tetromino.position[1] + y_offset
-                    
-                    # Check collision with board boundaries
-                    if not (0 <= board_x < self.width and 0 <= board_y < self.height):
-                        return True
-                    
-                    # Check collision with existing blocks on the board
-                    # Ensure board_y is valid before accessing self.board[board_y]
-                    if board_y >= 0 and self.board[board_y][board_x] != 0:
-                        return True
-        return False
+        return self._collides(tetromino.shape, tetromino.rotation,
+                              tetromino.position[0], tetromino.position[1])
+
+    def _collides(self, shape, rotation, px, py):
+        """
+        Collision test on primitives. The movement, rotation, and ghost
+        paths use this directly so they never have to build a throwaway
+        Tetromino just to ask the question.
+
+        Args:
+            shape (str): The shape name.
+            rotation (int): The rotation index.
+            px (int): The candidate x position.
+            py (int): The candidate y position.
+
+        Returns:
+            bool: True if a collision is detected, False otherwise.
+        """
+        return _COLLIDERS[shape, rotation](self.board, px, py, self.width, self.height)
 
     def rotate_tetromino(self):
         """
@@ -306,28 +524,20 @@ class GameEngine:
         if self.current_tetromino is None:
             return
 
-        current_shape_name = self.current_tetromino.shape
-        current_rotation_index = self.current_tetromino.rotation
-        
+        shape = self.current_tetromino.shape
         # Calculate the next rotation index
-        next_rotation_index = (current_rotation_index + 1) % len(SHAPES[current_shape_name])
-        new_tetromino = Tetromino(shape=current_shape_name, position=self.current_tetromino.position, rotation=next_rotation_index, color_id=self.current_tetromino.color_id)
-        
-        # If no collision after rotation, apply the rotation
-        if not self.check_collision(new_tetromino):
-            self.current_tetromino = new_tetromino
-            self.landing_time = None
-        else:
-            # Wall kick logic: try to move left/right if rotation causes collision
-            # This is a simplified wall kick, more complex rules exist in official Tetris
-            for dx in [-1, 1, -2, 2]: # Try small horizontal offsets
-                test_position = (self.current_tetromino.position[0] + dx, self.current_tetromino.position[1])
-                test_tetromino = Tetromino(shape=current_shape_name, position=test_position, rotation=next_rotation_index, color_id=self.current_tetromino.color_id)
-                if not self.check_collision(test_tetromino):
-                    self.current_tetromino = test_tetromino # Apply rotation and shift
-                    self.landing_time = None
-                    break
-        self.calculate_ghost_piece_position()
+        next_rotation = (self.current_tetromino.rotation + 1) % len(SHAPES[shape])
+        px, py = self.current_tetromino.position
+
+        # Try each kick offset with the specialized collider; only the
+        # offset that succeeds builds a new Tetromino.
+        collide = _COLLIDERS[shape, next_rotation]
+        for dx, dy in KICK_OFFSETS:
+            if not collide(self.board, px + dx, py + dy, self.width, self.height):
+                self.current_tetromino = self.current_tetromino._replace(
+                    position=(px + dx, py + dy), rotation=next_rotation)
+                self.landing_time = None
+                break
 
     def move_tetromino(self, direction):
         """
@@ -340,17 +550,18 @@ class GameEngine:
         Returns:
             bool: True if the move was successful (no collision), False otherwise.
         """
-        if self.current_tetromino is None:
+        tetromino = self.current_tetromino
+        if tetromino is None:
             return False
 
-        new_position = (self.current_tetromino.position[0] + direction[0], self.current_tetromino.position[1] + direction[1])
-        new_tetromino = Tetromino(shape=self.current_tetromino.shape, position=new_position, rotation=self.current_tetromino.rotation, color_id=self.current_tetromino.color_id)
-        
-        # If no collision after moving, apply the move
-        if not self.check_collision(new_tetromino):
-            self.current_tetromino = new_tetromino
+        new_x = tetromino.position[0] + direction[0]
+        new_y = tetromino.position[1] + direction[1]
+
+        # If no collision after moving, apply the move; a new Tetromino is
+        # only built once the move is known to succeed.
+        if not self._collides(tetromino.shape, tetromino.rotation, new_x, new_y):
+            self.current_tetromino = tetromino._replace(position=(new_x, new_y))
             self.landing_time = None
-            self.calculate_ghost_piece_position()
             return True
         return False
 
@@ -374,13 +585,32 @@ class GameEngine:
         """
         if self.current_tetromino is None:
             return
-        # Keep moving down until a collision is detected
-        while self.move_tetromino(DOWN):
-            pass
+        # The ghost position is the landing position, so jump straight to it
+        # instead of stepping down one collision check at a time.
+        self.calculate_ghost_piece_position()
+        self.current_tetromino = self.current_tetromino._replace(position=self.ghost_piece_position)
         if self.place_tetromino():
             return True
         return False
 
+# Sentinel actions the key dispatch can request from the main loop.
+QUIT_GAME = 'quit'
+TOGGLE_HELP = 'help'
+
+# Key dispatch for the PLAYING state: one dict lookup per keystroke instead
+# of walking an elif chain of ord() comparisons. Values are either a callable
+# applied to the engine or one of the sentinels above.
+KEYMAP = {
+    curses.KEY_LEFT: lambda engine: engine.move_tetromino(LEFT),
+    curses.KEY_RIGHT: lambda engine: engine.move_tetromino(RIGHT),
+    ord('z'): GameEngine.rotate_tetromino,
+    curses.KEY_DOWN: GameEngine.soft_drop,
+    ord(' '): GameEngine.hard_drop,
+    ord('c'): GameEngine.hold_tetromino,
+    ord('q'): QUIT_GAME,
+    ord('h'): TOGGLE_HELP,
+}
+
 class UserInterface:
     """
     Handles the display of the game board and other UI elements in the console
@@ -397,7 +627,31 @@ class UserInterface:
         """
         self.game_engine = game_engine
         self.stdscr = stdscr
-        
+        self.is_test_mode = is_test_mode
+        # Off-screen pad used as the draw buffer: the frame is composed on
+        # the pad, its rect is copied to the virtual screen once, and
+        # ncurses emits only the cells that actually changed. In test mode
+        # the mock screen plays both roles.
+        if is_test_mode:
+            self.win = stdscr
+        else:
+            self._pad_height = game_engine.height + 12
+            self._pad_width = max(40, game_engine.width * 2 + 20)
+            self.win = curses.newpad(self._pad_height, self._pad_width)
+        # The help text is static, so it is composed onto its own pad once
+        # (lazily, on first display) and blitted thereafter.
+        self._help_pad = None
+        # One prebuilt empty-board row, drawn with a single addstr per row.
+        self._empty_row = " ." * game_engine.width
+
+        # Dirty-region bookkeeping: what the last frame drew. When the
+        # settled board has not changed since then, draw_board only erases
+        # and redraws the piece/ghost cells instead of repainting the screen.
+        self._last_board_version = None
+        self._last_piece_cells = ()
+        self._last_ghost_cells = ()
+        self._last_info = None
+
         # Initialize color attributes for both test and non-test modes
         self.color_pair_map = {}
         self.default_pair_id = 0 # Default to 0 (no color) if curses not initialized or in test mode
@@ -407,9 +661,9 @@ class UserInterface:
         # Apply curses settings only if not in test mode
         if not is_test_mode:
             curses.curs_set(0) # Hide cursor to prevent flickering
-            self.stdscr.nodelay(1) # Make getch() non-blocking
-            # Set a timeout for getch() based on game_engine's fall_delay (converted to milliseconds)
-            self.stdscr.timeout(int(self.game_engine.fall_delay * 1000))
+            # getch() never blocks: waiting is done by select() on stdin in
+            # wait_for_input, with the timeout tracking the gravity deadline.
+            self.stdscr.nodelay(1)
 
             # Initialize colors
             if curses.has_colors():
@@ -432,138 +686,237 @@ class UserInterface:
                 curses.init_pair(pair_id_counter, curses.COLOR_WHITE, curses.COLOR_BLACK)
                 self.ghost_piece_pair_id = pair_id_counter
 
+        # Fully resolved curses attributes, computed once here so the draw
+        # loops do one dict lookup per piece instead of a color-id map get,
+        # a color_pair call, and a bitwise or per cell.
+        pair_for = self.color_pair_map.get
+        self._default_attr = curses.color_pair(self.default_pair_id)
+        self._ghost_attr = curses.color_pair(self.ghost_piece_pair_id) | curses.A_DIM
+        self._piece_attr = {
+            shape: curses.color_pair(pair_for(color_id, self.default_pair_id))
+            for shape, color_id in TETROMINO_COLORS.items()
+        }
+        self._settled_attr = {
+            color_id: curses.color_pair(pair_for(color_id, self.default_pair_id)) | curses.A_DIM
+            for color_id in TETROMINO_COLORS.values()
+        }
+
     def draw_board(self):
         """
         Clears the screen and draws the current state of the game board,
         the falling tetromino, score, level, time, next tetromino preview,
         and game over message if applicable, using curses colors.
         """
-        max_y, max_x = self.stdscr.getmaxyx()
-        
+        # Bind the engine, screen methods and invariants to locals once; the
+        # cell loops below then run without repeated attribute lookups.
+        engine = self.game_engine
+        # Ghost computation is deferred from the movement methods to here,
+        # where it is memoized — rapid key repeats between frames no longer
+        # trigger a recomputation each.
+        engine.calculate_ghost_piece_position()
+        stdscr = self.stdscr
+        win = self.win
+        addstr = win.addstr
+        attron = win.attron
+        attroff = win.attroff
+        board = engine.board
+        width = engine.width
+        height = engine.height
+
+        max_y, max_x = stdscr.getmaxyx()
+
         # Calculate required dimensions
         # Board takes game_engine.height rows and game_engine.width * 2 columns
         # Stats and previews take additional rows below the board
-        required_height = self.game_engine.height + 10 # Board height + 1 (spacing) + 4 (stats) + 1 (Next/Hold labels) + 4 (max tetromino height)
-        required_width = max(self.game_engine.width * 2, 20) # Board width or max length of info lines
+        required_height = height + 10 # Board height + 1 (spacing) + 4 (stats) + 1 (Next/Hold labels) + 4 (max tetromino height)
+        required_width = max(width * 2, 20) # Board width or max length of info lines
 
         if max_y < required_height or max_x < required_width:
-            self.stdscr.clear()
-            self.stdscr.addstr(0, 0, f"Terminal too small! Please resize to at least {required_height}x{required_width}.")
-            self.stdscr.addstr(1, 0, f"Current size: {max_y}x{max_x}")
-            self.stdscr.refresh()
+            stdscr.clear()
+            stdscr.addstr(0, 0, f"Terminal too small! Please resize to at least {required_height}x{required_width}.")
+            stdscr.addstr(1, 0, f"Current size: {max_y}x{max_x}")
+            stdscr.refresh()
+            self._last_board_version = None # The pad must fully repaint after a resize
             return # Skip drawing the board to prevent errors
-        
-        self.stdscr.clear() # Clear the entire screen
-        
-        # Draw game board (settled blocks)
-        for y in range(self.game_engine.height):
-            for x in range(self.game_engine.width):
-                block_color_id = self.game_engine.board[y][x]
-                if block_color_id != 0:
-                    # Get the curses color pair ID from our map
-                    pair_id = self.color_pair_map.get(block_color_id, self.default_pair_id)
-                    self.stdscr.attron(curses.color_pair(pair_id) | curses.A_DIM)
-                    self.stdscr.addstr(y, x * 2, "[]") 
-                    self.stdscr.attroff(curses.color_pair(pair_id) | curses.A_DIM)
-                else:
-                    # Use default color for empty spaces
-                    self.stdscr.attron(curses.color_pair(self.default_pair_id))
-                    self.stdscr.addstr(y, x * 2, " .") 
-                    self.stdscr.attroff(curses.color_pair(self.default_pair_id))
-        
+
+        # Screen positions of this frame's moving overlays, computed up front
+        # so they can be diffed against what the previous frame drew.
+        piece_cells = ()
+        ghost_cells = ()
+        if engine.current_tetromino:
+            cells = SHAPE_CELLS[engine.current_tetromino.shape][engine.current_tetromino.rotation]
+            piece_x, piece_y = engine.current_tetromino.position
+            piece_cells = tuple((piece_y + y_offset, piece_x + x_offset)
+                                for x_offset, y_offset in cells
+                                if 0 <= piece_x + x_offset < width and 0 <= piece_y + y_offset < height)
+            if engine.ghost_piece_position:
+                ghost_x, ghost_y = engine.ghost_piece_position
+                ghost_cells = tuple((ghost_y + y_offset, ghost_x + x_offset)
+                                    for x_offset, y_offset in cells
+                                    if 0 <= ghost_x + x_offset < width and 0 <= ghost_y + y_offset < height)
+
+        # Everything shown in the info panel, as one comparable tuple.
+        info = (engine.score, engine.level, engine.time_elapsed, engine.high_score,
+                engine.next_tetrominoes[0].shape if engine.next_tetrominoes else None,
+                engine.held_tetromino.shape if engine.held_tetromino else None)
+
+        default_attr = self._default_attr
+
+        if self._last_board_version == engine.board_version and not engine.game_over:
+            # The settled board has not changed since the last frame, so only
+            # the dirty region needs repainting: blank the cells the previous
+            # piece and ghost occupied, then fall through to redraw them at
+            # their new positions.
+            attron(default_attr)
+            for cell_y, cell_x in self._last_ghost_cells:
+                addstr(cell_y, cell_x * 2, " .")
+            for cell_y, cell_x in self._last_piece_cells:
+                addstr(cell_y, cell_x * 2, " .")
+            attroff(default_attr)
+            info_dirty = info != self._last_info
+            if info_dirty:
+                # Blank the preview area before redrawing it; the stats lines
+                # below overwrite themselves via space padding.
+                blank_row = " " * 20
+                for y in range(height + 6, height + 10):
+                    addstr(y, 0, blank_row)
+        else:
+            info_dirty = True
+            win.erase() # Blank the draw buffer without forcing a terminal clear
+
+            # Paint the empty board background one whole row per addstr call,
+            # then overlay only the settled blocks on top. Most cells are empty
+            # most of the time, so this replaces ~200 per-cell calls with
+            # `height` row calls plus one call per settled block.
+            empty_row = self._empty_row
+            attron(default_attr)
+            for y in range(height):
+                addstr(y, 0, empty_row)
+            attroff(default_attr)
+
+            # Draw game board (settled blocks), grouped by attribute so each
+            # color pays one attron/attroff toggle instead of one per cell.
+            settled_attr_for = self._settled_attr.get
+            default_dim_attr = default_attr | curses.A_DIM
+            cells_by_attr = {}
+            for y in range(height):
+                board_row = board[y]
+                for x in range(width):
+                    block_color_id = board_row[x]
+                    if block_color_id != 0:
+                        block_attr = settled_attr_for(block_color_id, default_dim_attr)
+                        cells_by_attr.setdefault(block_attr, []).append((y, x))
+            for block_attr, attr_cells in cells_by_attr.items():
+                attron(block_attr)
+                for y, x in attr_cells:
+                    addstr(y, x * 2, "[]")
+                attroff(block_attr)
+
         # Draw ghost piece
-        if self.game_engine.ghost_piece_position and self.game_engine.current_tetromino:
-            shape_data = SHAPES[self.game_engine.current_tetromino.shape][self.game_engine.current_tetromino.rotation]
-            self.stdscr.attron(curses.color_pair(self.ghost_piece_pair_id) | curses.A_DIM)
-            for y_offset, row in enumerate(shape_data):
-                for x_offset, cell in enumerate(row):
-                    if cell:
-                        board_x = self.game_engine.ghost_piece_position[0] + x_offset
-                        board_y = self.game_engine.ghost_piece_position[1] + y_offset
-                        if 0 <= board_x < self.game_engine.width and 0 <= board_y < self.game_engine.height:
-                            self.stdscr.addstr(board_y, board_x * 2, "::")
-            self.stdscr.attroff(curses.color_pair(self.ghost_piece_pair_id) | curses.A_DIM)
+        if ghost_cells:
+            ghost_attr = self._ghost_attr
+            attron(ghost_attr)
+            for cell_y, cell_x in ghost_cells:
+                addstr(cell_y, cell_x * 2, "::")
+            attroff(ghost_attr)
 
         # Draw current falling tetromino
-        if self.game_engine.current_tetromino:
-            shape_data = SHAPES[self.game_engine.current_tetromino.shape][self.game_engine.current_tetromino.rotation]
-            tetromino_color_id = self.game_engine.current_tetromino.color_id
-            pair_id = self.color_pair_map.get(tetromino_color_id, self.default_pair_id)
-            self.stdscr.attron(curses.color_pair(pair_id))
-            for y_offset, row in enumerate(shape_data):
-                for x_offset, cell in enumerate(row):
-                    if cell: # If it's a block in the tetromino shape
-                        board_x = self.game_engine.current_tetromino.position[0] + x_offset
-                        board_y = self.game_engine.current_tetromino.position[1] + y_offset
-                        # Only draw if within visible board boundaries
-                        if 0 <= board_x < self.game_engine.width and 0 <= board_y < self.game_engine.height:
-                            self.stdscr.addstr(board_y, board_x * 2, "[]")
-            self.stdscr.attroff(curses.color_pair(pair_id))
-                            
-        # Display game information: score, level, time, next tetromino
-        # Use default color for text
-        self.stdscr.attron(curses.color_pair(self.default_pair_id))
-        self.stdscr.addstr(self.game_engine.height + 1, 0, f"Score: {self.game_engine.score}")
-        self.stdscr.addstr(self.game_engine.height + 2, 0, f"Level: {self.game_engine.level}")
-        self.stdscr.addstr(self.game_engine.height + 3, 0, f"Time: {self.game_engine.time_elapsed}s")
-        self.stdscr.addstr(self.game_engine.height + 4, 0, f"High Score: {self.game_engine.high_score}")
-        self.stdscr.addstr(self.game_engine.height + 5, 0, "Next:")
-        self.stdscr.addstr(self.game_engine.height + 5, 10, "Hold:")
-        self.stdscr.attroff(curses.color_pair(self.default_pair_id))
-        
-        # Draw next tetromino preview
-        if self.game_engine.next_tetrominoes:
-            next_shape_data = SHAPES[self.game_engine.next_tetrominoes[0].shape][self.game_engine.next_tetrominoes[0].rotation]
-            next_tetromino_color_id = self.game_engine.next_tetrominoes[0].color_id
-            pair_id = self.color_pair_map.get(next_tetromino_color_id, self.default_pair_id)
-            self.stdscr.attron(curses.color_pair(pair_id))
-            for y_offset, row in enumerate(next_shape_data):
-                for x_offset, cell in enumerate(row):
-                    if cell:
-                        # Position the next tetromino preview below the "Next:" label
-                        self.stdscr.addstr(self.game_engine.height + 6 + y_offset, x_offset * 2, "[]")
-            self.stdscr.attroff(curses.color_pair(pair_id))
-
-        # Draw held tetromino preview
-        if self.game_engine.held_tetromino:
-            held_shape_data = SHAPES[self.game_engine.held_tetromino.shape][self.game_engine.held_tetromino.rotation]
-            held_tetromino_color_id = self.game_engine.held_tetromino.color_id
-            pair_id = self.color_pair_map.get(held_tetromino_color_id, self.default_pair_id)
-            self.stdscr.attron(curses.color_pair(pair_id))
-            for y_offset, row in enumerate(held_shape_data):
-                for x_offset, cell in enumerate(row):
-                    if cell:
-                        # Position the held tetromino preview below the "Hold:" label
-                        self.stdscr.addstr(self.game_engine.height + 6 + y_offset, 10 + x_offset * 2, "[]")
-            self.stdscr.attroff(curses.color_pair(pair_id))
-                        
+        if piece_cells:
+            piece_attr = self._piece_attr[engine.current_tetromino.shape]
+            attron(piece_attr)
+            for cell_y, cell_x in piece_cells:
+                addstr(cell_y, cell_x * 2, "[]")
+            attroff(piece_attr)
+
+        if info_dirty:
+            # Display game information: score, level, time, next tetromino.
+            # Lines are padded to the panel width so a partial redraw wipes
+            # any leftover digits from the previous values.
+            attron(default_attr)
+            addstr(height + 1, 0, f"Score: {engine.score}".ljust(20))
+            addstr(height + 2, 0, f"Level: {engine.level}".ljust(20))
+            addstr(height + 3, 0, f"Time: {engine.time_elapsed}s".ljust(20))
+            addstr(height + 4, 0, f"High Score: {engine.high_score}".ljust(20))
+            addstr(height + 5, 0, "Next:")
+            addstr(height + 5, 10, "Hold:")
+            attroff(default_attr)
+
+            # Draw next tetromino preview
+            if engine.next_tetrominoes:
+                next_tetromino = engine.next_tetrominoes[0]
+                next_cells = SHAPE_CELLS[next_tetromino.shape][next_tetromino.rotation]
+                next_attr = self._piece_attr[next_tetromino.shape]
+                attron(next_attr)
+                for x_offset, y_offset in next_cells:
+                    # Position the next tetromino preview below the "Next:" label
+                    addstr(height + 6 + y_offset, x_offset * 2, "[]")
+                attroff(next_attr)
+
+            # Draw held tetromino preview
+            if engine.held_tetromino:
+                held_cells = SHAPE_CELLS[engine.held_tetromino.shape][engine.held_tetromino.rotation]
+                held_attr = self._piece_attr[engine.held_tetromino.shape]
+                attron(held_attr)
+                for x_offset, y_offset in held_cells:
+                    # Position the held tetromino preview below the "Hold:" label
+                    addstr(height + 6 + y_offset, 10 + x_offset * 2, "[]")
+                attroff(held_attr)
+
         # Display "GAME OVER!" message if the game has ended
-        if self.game_engine.game_over:
-            self.stdscr.attron(curses.color_pair(self.default_pair_id) | curses.A_BOLD) # Bold for game over
-            self.stdscr.addstr(self.game_engine.height // 2, self.game_engine.width - 5, "GAME OVER!")
-            self.stdscr.addstr(self.game_engine.height // 2 + 1, self.game_engine.width - 8, "Press 'r' to restart")
-            self.stdscr.attroff(curses.color_pair(self.default_pair_id) | curses.A_BOLD)
+        if engine.game_over:
+            game_over_attr = default_attr | curses.A_BOLD # Bold for game over
+            attron(game_over_attr)
+            addstr(height // 2, width - 5, "GAME OVER!")
+            addstr(height // 2 + 1, width - 8, "Press 'r' to restart")
+            attroff(game_over_attr)
+
+        # Record what this frame drew for the next diff.
+        self._last_board_version = engine.board_version
+        self._last_piece_cells = piece_cells
+        self._last_ghost_cells = ghost_cells
+        self._last_info = info
+
+        # Copy the pad to the virtual screen and flush once; ncurses diffs
+        # against what the terminal already shows and emits only the change.
+        if self.is_test_mode:
+            win.noutrefresh()
+        else:
+            win.noutrefresh(0, 0, 0, 0,
+                            min(max_y, self._pad_height) - 1,
+                            min(max_x, self._pad_width) - 1)
+            curses.doupdate()
 
-        self.stdscr.refresh() # Update the physical screen
+    def invalidate(self):
+        """
+        Forces the next draw_board call to repaint the whole screen, e.g.
+        after the engine is swapped out on restart.
+        """
+        self._last_board_version = None
+        self._last_info = None
+
+    def _render_help(self, win):
+        """
+        Writes the help title, controls, and return instruction into a window.
+        """
+        win.attron(self._default_attr | curses.A_BOLD)
+        win.addstr(0, 0, "Tetris Controls:")
+        win.attroff(self._default_attr | curses.A_BOLD)
+
+        for i, control in enumerate(HELP_CONTROLS):
+            win.addstr(2 + i, 0, control)
+
+        win.addstr(len(HELP_CONTROLS) + 4, 0, "Press 'H' to return to game, or 'Q' to quit.")
 
     def draw_help_screen(self):
         """
-        Draws the help screen with controls and instructions.
+        Draws the help screen with controls and instructions. The text is
+        static, so it is composed once on a cached pad and blitted on later
+        calls.
         """
         max_y, max_x = self.stdscr.getmaxyx()
-        
-        controls = [
-            "Left Arrow: Move Left",
-            "Right Arrow: Move Right",
-            "Z: Rotate", # Updated control
-            "Down Arrow: Soft Drop",
-            "Spacebar: Hard Drop",
-            "C: Hold Piece",
-            "H: Toggle Help Screen",
-            "Q: Quit Game",
-            "R (Game Over): Restart Game"
-        ]
-        
+
+        controls = HELP_CONTROLS
+
         required_height = len(controls) + 5 # Title + spacing + controls + spacing + instruction
         required_width = max(len(c) for c in controls) + 5 # Longest control + some padding
         required_width = max(required_width, len("Press 'H' to return to game, or 'Q' to quit.") + 5)
@@ -575,52 +928,54 @@ class UserInterface:
             self.stdscr.refresh()
             return # Skip drawing the help screen to prevent errors
 
-        self.stdscr.clear()
-        self.stdscr.attron(curses.color_pair(self.default_pair_id) | curses.A_BOLD)
-        self.stdscr.addstr(0, 0, "Tetris Controls:")
-        self.stdscr.attroff(curses.color_pair(self.default_pair_id) | curses.A_BOLD)
-
-        controls = [
-            "Left Arrow: Move Left",
-            "Right Arrow: Move Right",
-            "Z: Rotate", # Updated control
-            "Down Arrow: Soft Drop",
-            "Spacebar: Hard Drop",
-            "C: Hold Piece",
-            "H: Toggle Help Screen",
-            "Q: Quit Game",
-            "R (Game Over): Restart Game"
-        ]
-
-        for i, control in enumerate(controls):
-            self.stdscr.addstr(2 + i, 0, control)
-        
-        self.stdscr.addstr(len(controls) + 4, 0, "Press 'H' to return to game, or 'Q' to quit.")
-        self.stdscr.refresh()
+        if self.is_test_mode:
+            self.stdscr.clear()
+            self._render_help(self.stdscr)
+            self.stdscr.refresh()
+            return
+
+        if self._help_pad is None:
+            self._help_pad = curses.newpad(required_height, required_width)
+            self._render_help(self._help_pad)
+        # Blank the virtual screen under the pad, then blit the cached text.
+        self.stdscr.erase()
+        self.stdscr.noutrefresh()
+        self._help_pad.noutrefresh(0, 0, 0, 0,
+                                   min(max_y, required_height) - 1,
+                                   min(max_x, required_width) - 1)
+        curses.doupdate()
 
     def draw_line_clear_animation(self):
         """
-        Draws the line clear animation.
+        Overlays the rows that were just cleared with a flash effect. Called
+        once per frame while the engine's animation window is open; pacing
+        comes from the main loop's clock, not a sleep.
         """
-        for y in self.game_engine.cleared_lines:
-            for x in range(self.game_engine.width):
-                self.stdscr.addstr(y, x * 2, "##")
-        self.stdscr.refresh()
-        time.sleep(0.1)
-
-        # The lines are already cleared in the game engine,
-        # so we just need to reset the cleared_lines list here.
-        self.game_engine.cleared_lines = []
+        engine = self.game_engine
+        win = self.win
+        flash_row = "##" * engine.width
+        for y in engine.cleared_lines:
+            win.addstr(y, 0, flash_row)
+        if self.is_test_mode:
+            win.noutrefresh()
+        else:
+            max_y, max_x = self.stdscr.getmaxyx()
+            win.noutrefresh(0, 0, 0, 0,
+                            min(max_y, self._pad_height) - 1,
+                            min(max_x, self._pad_width) - 1)
+            curses.doupdate()
+        # The flash scribbled over board rows, so the next draw_board must
+        # repaint in full.
+        self._last_board_version = None
 
     def draw_level_up_animation(self):
         """
         Draws the level up animation.
         """
-        self.stdscr.attron(curses.color_pair(self.default_pair_id) | curses.A_BOLD)
+        self.stdscr.attron(self._default_attr | curses.A_BOLD)
         self.stdscr.addstr(self.game_engine.height // 2, self.game_engine.width - 5, "LEVEL UP!")
         self.stdscr.refresh()
         time.sleep(1)
-        self.game_engine.level_up = False
 
     def get_input(self):
         """
@@ -636,6 +991,195 @@ class UserInterface:
         except:
             return -1 # No input available
 
+    def wait_for_input(self, timeout):
+        """
+        Waits up to `timeout` seconds for a key, sleeping in select() on
+        stdin rather than spinning in getch. The process blocks in a single
+        syscall until either a key arrives or the deadline passes, so the
+        wait can track the exact time until the next gravity tick.
+
+        Args:
+            timeout (float): Maximum seconds to wait; <= 0 polls once.
+
+        Returns:
+            int: The keycode, or -1 if the timeout expired with no input.
+        """
+        if self.is_test_mode:
+            return self.get_input()
+        if timeout > 0:
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if not ready:
+                return -1
+        return self.get_input()
+
+# Game states, as module constants shared by the per-state run functions.
+PLAYING = 0
+GAME_OVER = 1
+HELP_SCREEN = 2
+
+def _run_playing(game_engine, ui):
+    """
+    Runs the PLAYING state in a tight loop until it transitions out.
+
+    Returns:
+        int or None: The next state constant, or None to quit.
+    """
+    # Monotonic timing: immune to wall-clock (NTP/DST) jumps, and the
+    # gravity gate is a single integer compare against a deadline. The
+    # elapsed clock resumes from the engine's recorded seconds so a trip
+    # through the help screen doesn't reset it.
+    # Hoist the hot names to locals once: lookups inside the loop become
+    # LOAD_FAST instead of a global/attribute walk per iteration. Safe
+    # because reset() mutates the engine in place — these bound methods
+    # never go stale.
+    monotonic_ns = time.monotonic_ns
+    monotonic = time.monotonic
+    keymap_get = KEYMAP.get
+    key_left = curses.KEY_LEFT
+    key_right = curses.KEY_RIGHT
+    key_down = curses.KEY_DOWN
+    soft_drop = game_engine.soft_drop
+    move_tetromino = game_engine.move_tetromino
+    wait_for_input = ui.wait_for_input
+    get_input = ui.get_input
+
+    start_ns = monotonic_ns() - game_engine.time_elapsed * 1_000_000_000
+    next_fall_ns = monotonic_ns() + game_engine.fall_delay_ns
+    dirty = True # Whether visible state changed since the last draw
+
+    while True:
+        if game_engine.game_over:
+            return GAME_OVER
+
+        now_ns = monotonic_ns()
+        elapsed = (now_ns - start_ns) // 1_000_000_000
+        if elapsed != game_engine.time_elapsed:
+            game_engine.time_elapsed = elapsed
+            dirty = True # The on-screen clock ticked
+
+        # While the line-clear flash window is open, gravity pauses and
+        # the flash is overlaid each frame; when it closes, the flash
+        # rows are dropped and normal drawing resumes.
+        animating = now_ns < game_engine.animation_until_ns
+        if not animating and game_engine.cleared_lines:
+            game_engine.cleared_lines = []
+            dirty = True
+
+        if game_engine.landing_time and monotonic() - game_engine.landing_time > game_engine.lock_delay:
+            game_engine.place_tetromino()
+            game_engine.landing_time = None
+            dirty = True
+
+        # Gravity fires whenever its deadline has passed — normally via
+        # the select timeout, but a stream of keys can no longer starve
+        # the fall tick. The deadline accumulates (+= period) so per-tick
+        # processing time doesn't slow the fall rate; after a long stall
+        # (suspended process, slow terminal) it clamps forward instead of
+        # firing a burst of catch-up drops.
+        if not animating and now_ns >= next_fall_ns:
+            soft_drop()
+            fall_period_ns = game_engine.fall_delay_ns
+            next_fall_ns += fall_period_ns
+            if next_fall_ns < now_ns:
+                next_fall_ns = now_ns + fall_period_ns
+            dirty = True
+
+        # Sleep in select() until a key arrives or the next deadline —
+        # gravity, or the end of the flash window — whichever is sooner,
+        # capped so the on-screen clock never lags by more than 250ms.
+        wait_until_ns = next_fall_ns
+        if animating and game_engine.animation_until_ns < wait_until_ns:
+            wait_until_ns = game_engine.animation_until_ns
+        wait = (wait_until_ns - monotonic_ns()) / 1e9
+        key = wait_for_input(min(wait, 0.25))
+
+        # Drain the whole pending burst (getch is non-blocking) and
+        # coalesce movement keys: a held arrow costs one net move and
+        # one redraw instead of a dispatch and repaint per autorepeat.
+        to_help = False
+        net_dx = 0
+        down_count = 0
+        while key != -1:
+            if key == key_left:
+                net_dx -= 1
+            elif key == key_right:
+                net_dx += 1
+            elif key == key_down:
+                down_count += 1
+            else:
+                action = keymap_get(key)
+                if action is QUIT_GAME:
+                    return None
+                elif action is TOGGLE_HELP:
+                    to_help = True
+                    break
+                elif action is not None:
+                    action(game_engine)
+                    dirty = True
+            key = get_input()
+        if net_dx:
+            step = RIGHT if net_dx > 0 else LEFT
+            for _ in range(abs(net_dx)):
+                if not move_tetromino(step):
+                    break
+            dirty = True
+        if down_count:
+            for _ in range(down_count):
+                soft_drop()
+            dirty = True
+        if to_help:
+            return HELP_SCREEN
+
+        # Draw only when something visible changed; idle timeout wakeups
+        # inside the same second cost no terminal traffic at all.
+        if dirty:
+            ui.draw_board()
+            if game_engine.cleared_lines:
+                ui.draw_line_clear_animation()
+            dirty = False
+
+def _run_game_over(game_engine, ui):
+    """
+    Shows the game-over overlay once and polls for restart/help/quit.
+
+    Returns:
+        int or None: The next state constant, or None to quit.
+    """
+    key_restart, key_quit, key_help = ord('r'), ord('q'), ord('h')
+    ui.draw_board() # The overlay is static — drawn once on entry
+    while True:
+        key = ui.wait_for_input(0.25)
+        if key == key_restart:
+            game_engine.reset() # Restart in place — no stale references
+            ui.invalidate() # The whole screen is stale after a restart
+            return PLAYING
+        elif key == key_quit: # Quit
+            return None
+        elif key == key_help: # Toggle help screen
+            return HELP_SCREEN
+
+def _run_help(game_engine, ui):
+    """
+    Shows the (cached) help screen once and polls until it is dismissed.
+
+    Returns:
+        int: The next state constant.
+    """
+    key_help, key_quit = ord('h'), ord('q')
+    ui.draw_help_screen() # Static — blitted once on entry
+    while True:
+        key = ui.wait_for_input(0.25)
+        if key == key_help or key == key_quit: # Exit help screen
+            return PLAYING
+
+# State dispatch table, built once at import. Handlers return the next
+# state constant, or None as the quit sentinel.
+STATE_HANDLERS = {
+    PLAYING: _run_playing,
+    GAME_OVER: _run_game_over,
+    HELP_SCREEN: _run_help,
+}
+
 def main(stdscr):
     # Prompt for starting level
     start_level_input = ""
@@ -646,86 +1190,46 @@ def main(stdscr):
         curses.echo() # Enable echoing of characters
         start_level_input = stdscr.getstr(0, 29, 2).decode('utf-8') # Read up to 2 characters
         curses.noecho() # Disable echoing
-    
+
     start_level = int(start_level_input)
 
     game_engine = GameEngine(start_level=start_level)
     ui = UserInterface(game_engine, stdscr)
-    start_time = time.time()
+    # Level-up is delivered as an engine event rather than a flag the
+    # PLAYING loop polls every iteration. Registered once; reset() keeps
+    # the callback, so it survives a restart.
+    game_engine.on_level_up = lambda new_delay: ui.draw_level_up_animation()
 
-    # Define game states
-    PLAYING = 0
-    GAME_OVER = 1
-    HELP_SCREEN = 2
-    LINE_CLEAR_ANIMATION = 3
-    current_game_state = PLAYING # Initial state
+    # Each state runs as its own tight loop and returns the next state
+    # (or the None sentinel to quit), so the hot PLAYING path pays no
+    # per-iteration state dispatch and the top-level loop is one dict
+    # lookup per state transition.
+    state = PLAYING
+    while state is not None:
+        state = STATE_HANDLERS[state](game_engine, ui)
 
-    while True:
-        if current_game_state == PLAYING:
-            if game_engine.game_over:
-                current_game_state = GAME_OVER
-                continue
-
-            current_time = time.time()
-            game_engine.time_elapsed = int(current_time - start_time)
-
-            if game_engine.landing_time and time.time() - game_engine.landing_time > game_engine.lock_delay:
-                if game_engine.place_tetromino():
-                    current_game_state = LINE_CLEAR_ANIMATION
-                game_engine.landing_time = None
-
-            key = ui.get_input()
-
-            if key == curses.KEY_LEFT:
-                game_engine.move_tetromino(LEFT)
-            elif key == curses.KEY_RIGHT:
-                game_engine.move_tetromino(RIGHT)
-            elif key == ord('z'): # Rotate with 'Z' key
-                game_engine.rotate_tetromino()
-            elif key == curses.KEY_DOWN: # Soft drop
-                if game_engine.soft_drop():
-                    current_game_state = LINE_CLEAR_ANIMATION
-            elif key == ord(' '): # Hard drop
-                if game_engine.hard_drop():
-                    current_game_state = LINE_CLEAR_ANIMATION
-            elif key == ord('c'): # Hold piece
-                game_engine.hold_tetromino()
-            elif key == ord('q'): # Quit
-                break
-            elif key == ord('h'): # Toggle help screen
-                current_game_state = HELP_SCREEN
-                
-            game_engine.soft_drop() # Tetromino falls automatically
-
-            ui.draw_board()
 
-        elif current_game_state == GAME_OVER:
-            key = ui.get_input()
-            if key == ord('r'):
-                game_engine = GameEngine() # Reset game
-                ui.game_engine = game_engine # Update UI's reference to new engine
-                start_time = time.time() # Reset timer
-                current_game_state = PLAYING # Go back to playing
-            elif key == ord('q'): # Quit
-                break
-            elif key == ord('h'): # Toggle help screen
-                current_game_state = HELP_SCREEN
-            ui.draw_board() # Still draw board to show game over message
-
-        elif current_game_state == HELP_SCREEN:
-            key = ui.get_input()
-            if key == ord('h') or key == ord('q'): # Exit help screen or quit
-                current_game_state = PLAYING # Go back to playing
-            ui.draw_help_screen() # Draw the help screen
+def run():
+    """
+    Initializes curses by hand and guarantees terminal restoration.
 
-        elif current_game_state == LINE_CLEAR_ANIMATION:
-            ui.draw_line_clear_animation()
-            if game_engine.level_up:
-                ui.draw_level_up_animation()
-                # Update the curses timeout when level changes
-                stdscr.timeout(int(game_engine.fall_delay * 1000))
-            current_game_state = PLAYING
+    A minimal replacement for curses.wrapper(): cbreak + noecho + keypad
+    give unbuffered keystrokes directly (the UI sets nodelay and hides
+    the cursor itself), and the finally block restores the terminal even
+    if the game loop raises.
+    """
+    stdscr = curses.initscr()
+    try:
+        curses.noecho()
+        curses.cbreak()
+        stdscr.keypad(True)
+        main(stdscr)
+    finally:
+        stdscr.keypad(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
 
 
 if __name__ == '__main__':
-    curses.wrapper(main)
+    run()